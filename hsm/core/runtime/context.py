@@ -2,16 +2,14 @@
 
 import threading
 import time
-from dataclasses import dataclass
-from typing import Dict, Optional, Set
+from typing import Dict, NamedTuple, Optional, Set
 
 from ..events import Event
 from ..states import CompositeState, State
 from .graph import StateGraph
 
 
-@dataclass
-class _StateHistoryRecord:
+class _StateHistoryRecord(NamedTuple):
     """Immutable record of historical state information."""
 
     timestamp: float
@@ -42,14 +40,11 @@ class RuntimeContext:
         Returns True if a transition was taken.
         """
         with self._transition_lock:
-            # Get valid transitions from the graph
-            valid_transitions = self._graph.get_valid_transitions(self._current_state, event)
-            if not valid_transitions:
+            # Take highest priority valid transition from the graph
+            transition = self._graph.get_best_transition(self._current_state, event)
+            if transition is None:
                 return False
 
-            # Take highest priority transition
-            transition = max(valid_transitions, key=lambda t: t.get_priority())
-
             # Record history before exit
             self._record_history(self._current_state)
 
@@ -7,7 +7,7 @@ from ..base import StateBase
 from ..errors import ValidationError
 from ..events import Event
 from ..states import CompositeState, State
-from ..transitions import Transition
+from ..transitions import Transition, _TransitionPrioritySorter
 
 
 @dataclass
@@ -76,6 +76,13 @@ class StateGraph:
             reverse=True,
         )
 
+    def get_best_transition(self, state: State, event: Event) -> Optional[Transition]:
+        """Get the highest priority valid transition from a state for an event."""
+        transitions = self._transitions.get(state)
+        if not transitions:
+            return None
+        return _TransitionPrioritySorter.select(transitions, event)
+
     def get_ancestors(self, state: State) -> List[State]:
         """Get all ancestor states in order from immediate parent to root."""
         if state not in self._nodes:
@@ -5,8 +5,7 @@
 import asyncio
 import threading
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, NamedTuple, Optional, Set
 
 from hsm.core.events import Event
 from hsm.core.hooks import HookManager, HookProtocol
@@ -17,8 +16,7 @@ from hsm.core.transitions import Transition, _TransitionPrioritySorter
 from hsm.core.validations import ValidationError, Validator
 
 
-@dataclass(frozen=True)
-class _StateHistoryRecord:
+class _StateHistoryRecord(NamedTuple):
     """Immutable record of historical state information"""
 
     timestamp: float
@@ -36,6 +34,7 @@ class _StateMachineContext:
         self._initial_state = initial_state  # Store initial state
         self._current_state = initial_state
         self._transitions: List[Transition] = []
+        self._transitions_by_source: Dict[State, List[Transition]] = {}
         self._states = {initial_state}  # Track all states
         self._history: Dict[CompositeState, _StateHistoryRecord] = {}
         self._history_lock = threading.Lock()
@@ -55,6 +54,7 @@ class _StateMachineContext:
 
     def add_transition(self, transition: Transition) -> None:
         self._transitions.append(transition)
+        self._transitions_by_source.setdefault(transition.source, []).append(transition)
         # Track states from transitions
         self._states.add(transition.source)
         self._states.add(transition.target)
@@ -72,12 +72,11 @@ class _StateMachineContext:
     def process_event(self, event: Event) -> None:
         """Process an event in the current context."""
         # Implementation similar to StateMachine.process_event
-        valid_transitions = [
-            t for t in self._transitions if t.source == self._current_state and t.evaluate_guards(event)
-        ]
-        if valid_transitions:
-            transition = sorted(valid_transitions, key=lambda t: t.get_priority(), reverse=True)[0]
-            self._current_state.on_exit()
+        current = self._current_state
+        candidates = self._transitions_by_source.get(current, ())
+        transition = _TransitionPrioritySorter.select(candidates, event)
+        if transition is not None:
+            current.on_exit()
             transition.execute_actions(event)
             self._current_state = transition.target
             self._current_state.on_enter()
@@ -204,7 +203,8 @@ class StateMachine:
             return
 
         # Resolve the correct starting state
-        self._current_state = self._resolve_state_for_start()
+        initial = self._resolve_state_for_start()
+        self._current_state = initial
 
         # Validate machine structure
         errors = self._graph.validate()
@@ -212,7 +212,7 @@ class StateMachine:
             raise ValidationError("\n".join(errors))
 
         self._validator.validate_state_machine(self)
-        self._notify_enter(self._current_state)
+        self._notify_enter(initial)
         self._started = True
 
     def stop(self) -> None:
@@ -220,58 +220,63 @@ class StateMachine:
         if not self._started:
             return
 
-        if self._current_state:
+        current = self._current_state
+        if current:
+            context = self._context
             # Record history before stopping
-            parent = self._get_parent_composite_state(self._current_state)
+            parent = self._get_parent_composite_state(current)
             if parent:
-                self._context.record_state_exit(parent, self._current_state)
+                context.record_state_exit(parent, current)
 
-            self._notify_exit(self._current_state)
+            self._notify_exit(current)
             self._current_state = None
-            self._context._current_state = None
+            context._current_state = None
 
         self._started = False
 
     def process_event(self, event: Event) -> bool:
         """Process an event and perform any valid transitions."""
-        if not self._started or not self._current_state:
+        active_state = self._current_state
+        if not self._started or not active_state:
             return False
 
         # If current state is composite, use its active child state for transitions
-        active_state = self._current_state
         if isinstance(active_state, CompositeState):
             active_state = active_state._initial_state
 
-        valid_transitions = self._graph.get_valid_transitions(active_state, event)
-        if not valid_transitions:
+        # Take highest priority valid transition
+        transition = self._graph.get_best_transition(active_state, event)
+        if transition is None:
             return False
 
-        # Take highest priority transition
-        transition = max(valid_transitions, key=lambda t: t.get_priority())
         self._execute_transition(transition, event)
         return True
 
     def _execute_transition(self, transition: Transition, event: Event) -> None:
         """Execute a transition between states."""
-        if not self._current_state:
+        current = self._current_state
+        if not current:
             return
 
         try:
             # Record history for all ancestor composite states
-            ancestors = self._graph.get_ancestors(self._current_state)
-            for ancestor in ancestors:
-                if isinstance(ancestor, CompositeState):
-                    self._context.record_state_exit(ancestor, self._current_state)
+            ancestors = self._graph.get_ancestors(current)
+            if ancestors:
+                record_state_exit = self._context.record_state_exit
+                for ancestor in ancestors:
+                    if isinstance(ancestor, CompositeState):
+                        record_state_exit(ancestor, current)
 
             # Exit current state
-            self._notify_exit(self._current_state)
+            self._notify_exit(current)
 
             # Execute transition actions
             transition.execute_actions(event)
 
             # Enter new state
-            self._current_state = transition.target
-            self._notify_enter(self._current_state)
+            target = transition.target
+            self._current_state = target
+            self._notify_enter(target)
 
         except Exception as e:
             # Notify hooks of error
@@ -287,25 +292,27 @@ class StateMachine:
     def _notify_enter(self, state: State) -> None:
         """Notify hooks of state entry."""
         state.on_enter()
+        iscoroutinefunction = asyncio.iscoroutinefunction
         for hook in self._hooks:
-            if hasattr(hook, "on_enter"):
-                hook_method = hook.on_enter
-                # Skip async hooks in synchronous context
-                if not asyncio.iscoroutinefunction(hook_method):
-                    hook_method(state)
+            hook_method = getattr(hook, "on_enter", None)
+            # Skip async hooks in synchronous context
+            if hook_method is not None and not iscoroutinefunction(hook_method):
+                hook_method(state)
 
     def _notify_exit(self, state: State) -> None:
         """Notify hooks of state exit."""
         state.on_exit()
         for hook in self._hooks:
-            if hasattr(hook, "on_exit"):
-                hook.on_exit(state)
+            hook_method = getattr(hook, "on_exit", None)
+            if hook_method is not None:
+                hook_method(state)
 
     def _notify_error(self, error: Exception) -> None:
         """Notify hooks of an error."""
         for hook in self._hooks:
-            if hasattr(hook, "on_error"):
-                hook.on_error(error)
+            hook_method = getattr(hook, "on_error", None)
+            if hook_method is not None:
+                hook_method(error)
 
     def detect_cycles(self) -> List[str]:
         """Detect cycles in the state hierarchy."""
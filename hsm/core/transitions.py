@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, List, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional
 
 from hsm.core.errors import TransitionError
 from hsm.core.events import Event
@@ -51,6 +51,9 @@ class Transition:
         :param event: The triggering event.
         :return: True if all guards pass, otherwise False.
         """
+        # Unguarded transitions are common; skip building the evaluator for them
+        if not self._guards:
+            return True
         return _GuardEvaluator().evaluate(self._guards, event)
 
     def execute_actions(self, event: Event) -> None:
@@ -111,12 +114,34 @@ class _TransitionPrioritySorter:
         """
         return sorted(transitions, key=lambda t: t.get_priority(), reverse=True)
 
+    @staticmethod
+    def select(transitions: Iterable[Transition], event: Event) -> Optional[Transition]:
+        """
+        Return the highest priority transition whose guards pass, in a single
+        pass and without building an intermediate list. Ties go to the first
+        candidate encountered, matching the order a stable sort would give.
+
+        :param transitions: Candidate Transition instances.
+        :param event: The event to evaluate guards against.
+        :return: The chosen Transition, or None if no guards pass.
+        """
+        best = None
+        best_priority = 0
+        for t in transitions:
+            if t.evaluate_guards(event):
+                priority = t.get_priority()
+                if best is None or priority > best_priority:
+                    best, best_priority = t, priority
+        return best
+
 
 class _GuardEvaluator:
     """
     Internal helper to evaluate a list of guard conditions against an event.
     """
 
+    __slots__ = ()
+
     def evaluate(self, guards: List[Callable[[Event], bool]], event: Event) -> bool:
         """
         Check all guards. Return True if all pass, False if any fail.
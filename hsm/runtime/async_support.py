@@ -5,7 +5,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional
 
 from hsm.core.errors import ValidationError
 from hsm.core.events import Event
@@ -15,27 +16,14 @@ from hsm.core.states import State
 from hsm.core.transitions import Transition
 from hsm.core.validations import Validator
 
-
-class _AsyncLock:
-    """
-    Internal async-compatible lock abstraction, providing awaitable acquisition
-    methods.
-    """
-
-    def __init__(self) -> None:
-        self._lock = asyncio.Lock()
-
-    async def acquire(self) -> None:
-        await self._lock.acquire()
-
-    def release(self) -> None:
-        self._lock.release()
+# Upper bound on events handled per wakeup of the processing loop
+_MAX_BATCH_SIZE = 64
 
 
 class AsyncEventQueue:
     """
-    An asynchronous event queue providing non-blocking enqueue/dequeue methods,
-    suitable for use with AsyncStateMachine.
+    An asynchronous event queue providing non-blocking enqueue and awaitable
+    dequeue methods, suitable for use with AsyncStateMachine.
     """
 
     def __init__(self, priority: bool = False) -> None:
@@ -43,38 +31,56 @@ class AsyncEventQueue:
         Initialize the async event queue.
 
         :param priority: If True, operates in a priority-based mode.
-                         Currently, we only implement a simple FIFO using asyncio.Queue.
+                         Currently, we only implement a simple FIFO using a deque.
                          Priority mode could be implemented separately if needed.
         """
         self._priority_mode = priority
         # For simplicity, we ignore priority in the async variant and just use FIFO.
-        self._queue = asyncio.Queue()
+        # A plain deque plus a wakeup signal avoids asyncio.Queue's per-item futures.
+        self._items: Deque[Event] = deque()
+        self._wakeup = asyncio.Event()
 
-    async def enqueue(self, event: Event) -> None:
+    def enqueue(self, event: Event) -> None:
         """
-        Asynchronously insert an event into the queue.
+        Insert an event into the queue and wake any waiting consumer.
         """
-        await self._queue.put(event)
+        self._items.append(event)
+        self._wakeup.set()
 
-    async def dequeue(self) -> Optional[Event]:
+    async def dequeue(self) -> Event:
         """
-        Asynchronously retrieve the next event, or None if empty.
+        Asynchronously retrieve the next event.
         This will block until an event is available.
-        If a non-blocking or timeout approach is needed, adapt accordingly.
         """
-        try:
-            # Wait for an event with a small timeout
-            return await asyncio.wait_for(self._queue.get(), timeout=0.1)
-        except asyncio.TimeoutError:
-            return None
+        items = self._items
+        while not items:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+        return items.popleft()
+
+    def dequeue_nowait(self) -> Optional[Event]:
+        """
+        Remove and return the next event if one is already queued, without
+        waiting for more to arrive.
+
+        :return: The next event or None if queue is empty.
+        """
+        items = self._items
+        return items.popleft() if items else None
+
+    def requeue(self, event: Event) -> None:
+        """
+        Put an event back at the front of the queue, ahead of anything enqueued
+        since it was removed, and wake any waiting consumer.
+        """
+        self._items.appendleft(event)
+        self._wakeup.set()
 
-    async def clear(self) -> None:
+    def clear(self) -> None:
         """
-        Asynchronously clear all events from the queue.
-        This is not a standard asyncio.Queue operation; we implement by draining.
+        Clear all events from the queue.
         """
-        while not self._queue.empty():
-            await self._queue.get()
+        self._items.clear()
 
     @property
     def priority_mode(self) -> bool:
@@ -99,62 +105,81 @@ class AsyncStateMachine(StateMachine):
             return
 
         # Resolve the correct starting state
-        self._current_state = self._resolve_state_for_start()
+        initial = self._resolve_state_for_start()
+        self._current_state = initial
 
         # Validate machine structure with potential async validator
         errors = self._graph.validate()
         if errors:
             raise ValidationError("\n".join(errors))
 
-        if hasattr(self._validator, "validate_state_machine"):
-            validate_method = self._validator.validate_state_machine
+        validate_method = getattr(self._validator, "validate_state_machine", None)
+        if validate_method is not None:
             if asyncio.iscoroutinefunction(validate_method):
                 await validate_method(self)
             else:
                 validate_method(self)
 
-        self._notify_enter(self._current_state)
+        self._notify_enter(initial)
         self._started = True
 
     async def stop(self) -> None:
         """Stop the state machine asynchronously."""
         if not self._started:
             return
-        if self._current_state:
-            await self._notify_exit_async(self._current_state)
+        current = self._current_state
+        if current:
+            await self._notify_exit_async(current)
         self._current_state = None
         self._started = False
 
     async def process_event(self, event: Event) -> bool:
         """Process an event asynchronously."""
-        if not self._started or not self._current_state:
+        current = self._current_state
+        if not self._started or not current:
             return False
 
-        valid_transitions = self._graph.get_valid_transitions(self._current_state, event)
-        if not valid_transitions:
+        # Take highest priority valid transition
+        transition = self._graph.get_best_transition(current, event)
+        if transition is None:
             return False
 
-        # Take highest priority transition
-        transition = max(valid_transitions, key=lambda t: t.get_priority())
         await self._execute_transition_async(transition, event)
         return True
 
+    async def process_events(self, events: Iterable[Event]) -> int:
+        """
+        Process a batch of events in order.
+
+        :param events: Events to process.
+        :return: The number of events that triggered a transition.
+        """
+        process_event = self.process_event
+        handled = 0
+        for event in events:
+            if await process_event(event):
+                handled += 1
+        return handled
+
     async def _execute_transition_async(self, transition: Transition, event: Event) -> None:
         """Execute a transition asynchronously."""
         try:
             await self._notify_exit_async(self._current_state)
             transition.execute_actions(event)
-            self._current_state = transition.target
-            await self._notify_enter_async(self._current_state)
+            target = transition.target
+            self._current_state = target
+            await self._notify_enter_async(target)
         except Exception as e:
             # Handle error only once, at the top level
+            iscoroutinefunction = asyncio.iscoroutinefunction
             for hook in self._hooks:
-                if hasattr(hook, "on_error"):
-                    hook_method = hook.on_error
-                    if asyncio.iscoroutinefunction(hook_method):
-                        await hook_method(e)
-                    else:
-                        hook_method(e)
+                hook_method = getattr(hook, "on_error", None)
+                if hook_method is None:
+                    continue
+                if iscoroutinefunction(hook_method):
+                    await hook_method(e)
+                else:
+                    hook_method(e)
 
             # Error recovery is separate from error hooks
             if hasattr(self, "_error_recovery"):
@@ -163,25 +188,29 @@ class AsyncStateMachine(StateMachine):
     async def _notify_enter_async(self, state: State) -> None:
         """Notify hooks of state entry asynchronously."""
         state.on_enter()
+        iscoroutinefunction = asyncio.iscoroutinefunction
         for hook in self._hooks:
-            if hasattr(hook, "on_enter"):
-                hook_method = hook.on_enter
-                if asyncio.iscoroutinefunction(hook_method):
-                    await hook_method(state)
-                else:
-                    hook_method(state)
+            hook_method = getattr(hook, "on_enter", None)
+            if hook_method is None:
+                continue
+            if iscoroutinefunction(hook_method):
+                await hook_method(state)
+            else:
+                hook_method(state)
 
     async def _notify_exit_async(self, state: State) -> None:
         """Notify hooks of state exit asynchronously."""
         # No try/except here - let errors propagate up
         state.on_exit()
+        iscoroutinefunction = asyncio.iscoroutinefunction
         for hook in self._hooks:
-            if hasattr(hook, "on_exit"):
-                hook_method = hook.on_exit
-                if asyncio.iscoroutinefunction(hook_method):
-                    await hook_method(state)
-                else:
-                    hook_method(state)
+            hook_method = getattr(hook, "on_exit", None)
+            if hook_method is None:
+                continue
+            if iscoroutinefunction(hook_method):
+                await hook_method(state)
+            else:
+                hook_method(state)
 
 
 class _AsyncEventProcessingLoop:
@@ -197,25 +226,57 @@ class _AsyncEventProcessingLoop:
         self._machine = machine
         self._queue = event_queue
         self._running = False
+        self._stop_requested = asyncio.Event()
 
     async def start_loop(self) -> None:
         """
         Begin processing events asynchronously.
         """
         self._running = True
+        self._stop_requested.clear()
         await self._machine.start()  # Ensure machine started
 
-        while self._running:
-            event = await self._queue.dequeue()
-            if event:
-                await self._machine.process_event(event)
-            else:
-                # If no event, we can await a small sleep or wait again
-                await asyncio.sleep(0.01)
+        # Wait on the queue and the stop signal together so an idle loop wakes
+        # only when there is work to do or stop_loop() is called.
+        stop_wait = asyncio.ensure_future(self._stop_requested.wait())
+        next_event = None
+        try:
+            while self._running:
+                next_event = asyncio.ensure_future(self._queue.dequeue())
+                done, _ = await asyncio.wait({next_event, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+                if not self._running or next_event not in done:
+                    # An event taken off the queue as stop was requested is handed back
+                    if next_event in done:
+                        self._queue.requeue(next_event.result())
+                    break
+                # Handle whatever else arrived meanwhile before waiting again
+                await self._machine.process_events(self._iter_batch(next_event.result()))
+        finally:
+            stop_wait.cancel()
+            if next_event is not None:
+                next_event.cancel()
+
+    def _iter_batch(self, first: Event) -> Iterator[Event]:
+        """
+        Yield the already-dequeued event, then further queued events one at a
+        time. Each event is only taken off the queue once the previous one has
+        been processed, so stopping the loop or an error mid-batch leaves the
+        rest of the queue intact.
+        """
+        yield first
+        dequeue_nowait = self._queue.dequeue_nowait
+        for _ in range(_MAX_BATCH_SIZE - 1):
+            if not self._running:
+                return
+            event = dequeue_nowait()
+            if event is None:
+                return
+            yield event
 
     async def stop_loop(self) -> None:
         """
         Stop processing events, allowing async tasks to conclude gracefully.
         """
         self._running = False
+        self._stop_requested.set()
         await self._machine.stop()
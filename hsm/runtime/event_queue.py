@@ -12,30 +12,6 @@ from typing import Optional
 from hsm.core.events import Event
 
 
-class _EventQueueLock:
-    """
-    Internal context manager ensuring thread-safe access to the event queue.
-    """
-
-    def __init__(self, lock: threading.Lock) -> None:
-        """
-        Prepare internal locking mechanism.
-        """
-        self._lock = lock
-
-    def __enter__(self) -> None:
-        """
-        Acquire the lock when entering the context.
-        """
-        self._lock.acquire()
-
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """
-        Release the lock when exiting the context.
-        """
-        self._lock.release()
-
-
 class _PriorityQueueWrapper:
     """
     Internal wrapper providing priority-based insertion and retrieval of events,
@@ -108,7 +84,7 @@ class EventQueue:
 
         :param event: The event to enqueue.
         """
-        with _EventQueueLock(self._lock):
+        with self._lock:
             if self._priority_mode:
                 self._queue.push(event)
             else:
@@ -120,7 +96,7 @@ class EventQueue:
 
         :return: The next event or None if queue is empty.
         """
-        with _EventQueueLock(self._lock):
+        with self._lock:
             if self._priority_mode:
                 return self._queue.pop()
             else:
@@ -132,7 +108,7 @@ class EventQueue:
         """
         Remove all events from the queue.
         """
-        with _EventQueueLock(self._lock):
+        with self._lock:
             self._queue.clear()
 
     @property
@@ -4,8 +4,9 @@
 
 from __future__ import annotations
 
+import heapq
 import time
-from typing import List
+from typing import Dict, List, Optional
 
 from hsm.core.events import TimeoutEvent
 
@@ -24,13 +25,17 @@ class Timer:
         """
         self._deadline = deadline
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """
         Check if the timer has reached its deadline.
 
+        :param now: Current time, if the caller has already read the clock.
+                    Lets one clock read be shared across many timers.
         :return: True if expired, False otherwise.
         """
-        return time.time() >= self._deadline
+        if now is None:
+            now = time.time()
+        return now >= self._deadline
 
     @property
     def deadline(self) -> float:
@@ -40,35 +45,83 @@ class Timer:
         return self._deadline
 
 
+# Cancelled entries are purged in bulk once the heap is at least this large and
+# this fraction of it is dead, mirroring asyncio's scheduled-timer housekeeping.
+_MIN_SCHEDULED_TIMEOUTS = 100
+_MIN_CANCELLED_TIMEOUTS_FRACTION = 0.5
+
+
 class _TimeoutRegistry:
     """
-    Internal component maintaining a list of timers and associated events,
-    allowing for expiration checks.
+    Internal component maintaining a deadline-ordered heap of TimeoutEvents,
+    allowing for expiration checks and cancellation.
     """
 
     def __init__(self) -> None:
         """
         Prepare internal structures to track timeouts.
         """
-        self._entries = []  # list of (Timer, TimeoutEvent) tuples
+        # [deadline, counter, event] entries; the counter keeps FIFO order for equal
+        # deadlines and means events themselves are never compared. Cancelled
+        # entries stay in the heap with event set to None until popped or purged.
+        self._heap: List[list] = []
+        self._counter = 0
+        self._pending: Dict[TimeoutEvent, List[list]] = {}
+        self._cancelled_count = 0
 
     def add(self, event: TimeoutEvent) -> None:
         """
         Record a TimeoutEvent for later checks.
         """
-        t = Timer(event.deadline)
-        self._entries.append((t, event))
-
-    def expired_events(self) -> List[TimeoutEvent]:
-        """
-        Return a list of TimeoutEvents whose time has passed.
-        Remove them from the registry.
-        """
-        now = time.time()
-        expired = [(timer, evt) for (timer, evt) in self._entries if now >= timer.deadline]
-        # Remove expired entries
-        self._entries = [(t, e) for (t, e) in self._entries if (t, e) not in expired]
-        return [evt for (t, evt) in expired]
+        entry = [event.deadline, self._counter, event]
+        self._counter += 1
+        heapq.heappush(self._heap, entry)
+        self._pending.setdefault(event, []).append(entry)
+
+    def remove(self, event: TimeoutEvent) -> bool:
+        """
+        Cancel every pending occurrence of a TimeoutEvent.
+
+        :return: True if the event was pending, False otherwise.
+        """
+        entries = self._pending.pop(event, None)
+        if entries is None:
+            return False
+        for entry in entries:
+            entry[2] = None
+        self._cancelled_count += len(entries)
+
+        heap_size = len(self._heap)
+        if heap_size > _MIN_SCHEDULED_TIMEOUTS and self._cancelled_count / heap_size > _MIN_CANCELLED_TIMEOUTS_FRACTION:
+            self._heap = [entry for entry in self._heap if entry[2] is not None]
+            heapq.heapify(self._heap)
+            self._cancelled_count = 0
+        return True
+
+    def expired_events(self, now: Optional[float] = None) -> List[TimeoutEvent]:
+        """
+        Return a list of TimeoutEvents whose time has passed, earliest deadline
+        first. Remove them from the registry.
+        """
+        if now is None:
+            now = time.time()
+        expired = []
+        heap = self._heap
+        pending = self._pending
+        heappop = heapq.heappop
+        # Only the expired prefix of the heap is touched; pending entries stay put
+        while heap and heap[0][0] <= now:
+            entry = heappop(heap)
+            event = entry[2]
+            if event is None:
+                self._cancelled_count -= 1
+                continue
+            entries = pending[event]
+            entries.remove(entry)
+            if not entries:
+                del pending[event]
+            expired.append(event)
+        return expired
 
 
 class _TimeSource:
@@ -105,10 +158,23 @@ class TimeoutScheduler:
         """
         self._registry.add(event)
 
-    def check_timeouts(self) -> List[TimeoutEvent]:
+    def cancel_timeout(self, event: TimeoutEvent) -> bool:
+        """
+        Remove a previously scheduled TimeoutEvent so it is never returned as
+        expired. Cancelled entries are discarded lazily rather than searched for
+        in the schedule.
+
+        :param event: The TimeoutEvent to cancel.
+        :return: True if the event was scheduled, False otherwise.
+        """
+        return self._registry.remove(event)
+
+    def check_timeouts(self, now: Optional[float] = None) -> List[TimeoutEvent]:
         """
         Check all scheduled timers, returning any that have expired and should be processed.
 
+        :param now: Current time, if the caller has already read the clock for
+                    this tick. Defaults to reading it once here.
         :return: List of TimeoutEvents ready to be triggered.
         """
-        return self._registry.expired_events()
+        return self._registry.expired_events(now)
@@ -199,7 +199,7 @@ async def test_async_integration(hook, validator):
 
     # Process event
     event = Event("test")
-    await eq.enqueue(event)
+    eq.enqueue(event)
     await machine.process_event(event)
 
     assert machine.current_state == end_state
@@ -179,3 +179,40 @@ def test_hook_behavior():
     hook.on_exit.assert_called_once_with(state1)
     assert hook.on_enter.call_count == 2  # Once for initial, once for transition
     hook.on_enter.assert_has_calls([call(state1), call(state2)])
+
+
+def test_context_process_event_uses_transitions_from_current_state():
+    """Test that the internal context only considers transitions leaving the current state."""
+    from hsm.core.state_machine import _StateMachineContext
+
+    state1 = State("state1")
+    state2 = State("state2")
+    state3 = State("state3")
+    context = _StateMachineContext(state1)
+    context.add_transition(Transition(source=state2, target=state3, priority=10))
+    context.add_transition(Transition(source=state1, target=state2))
+
+    context.process_event(Event("test"))
+    assert context.get_current_state() == state2
+
+    context.process_event(Event("test"))
+    assert context.get_current_state() == state3
+
+    # No transitions leave state3
+    context.process_event(Event("test"))
+    assert context.get_current_state() == state3
+
+
+def test_history_record_is_immutable():
+    """Test that recorded history entries cannot be modified after the fact."""
+    from hsm.core.state_machine import _StateMachineContext
+
+    child = State("child")
+    composite = CompositeState("composite", initial_state=child)
+    context = _StateMachineContext(child)
+    context.record_state_exit(composite, child)
+
+    record = context._history[composite]
+    assert record.state == child
+    with pytest.raises(AttributeError):
+        record.state = composite
@@ -31,6 +31,8 @@ def test_transition_evaluate_guards(dummy_state, dummy_event):
     assert t.evaluate_guards(dummy_event) is False
     t = Transition(dummy_state, dummy_state, guards=[true_guard])
     assert t.evaluate_guards(dummy_event) is True
+    t = Transition(dummy_state, dummy_state)
+    assert t.evaluate_guards(dummy_event) is True
 
 
 def test_transition_execute_actions(dummy_state, dummy_event):
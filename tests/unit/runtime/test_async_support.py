@@ -48,28 +48,17 @@ async def test_async_event_queue(mock_event):
     from hsm.runtime.async_support import AsyncEventQueue
 
     eq = AsyncEventQueue(priority=False)
-    await eq.enqueue(mock_event)
+    eq.enqueue(mock_event)
     out = await eq.dequeue()
     assert out == mock_event
-    await eq.clear()
-    empty = await eq.dequeue()
-    assert empty is None
+    eq.enqueue(mock_event)
+    eq.clear()
+    # Cleared queue has nothing to hand out, so dequeue keeps waiting
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(eq.dequeue(), timeout=0.05)
     assert eq.priority_mode is False
 
 
-@pytest.mark.asyncio
-async def test_async_lock():
-    from hsm.runtime.async_support import _AsyncLock
-
-    lock = _AsyncLock()
-    await lock.acquire()
-    # Verify lock is acquired
-    lock.release()
-    # Verify lock can be reacquired
-    await lock.acquire()
-    lock.release()
-
-
 @pytest.mark.asyncio
 async def test_async_state_machine_double_start(dummy_state):
     from hsm.runtime.async_support import AsyncStateMachine
@@ -126,6 +115,151 @@ async def test_async_event_processing_loop():
     await task
 
 
+@pytest.mark.asyncio
+async def test_async_event_processing_loop_handles_events_and_stops_promptly(dummy_state, mock_event):
+    from hsm.core.states import State
+    from hsm.core.transitions import Transition
+    from hsm.runtime.async_support import AsyncEventQueue, AsyncStateMachine, _AsyncEventProcessingLoop
+
+    target_state = State("target")
+    machine = AsyncStateMachine(initial_state=dummy_state)
+    machine.add_state(target_state)
+    machine.add_transition(Transition(source=dummy_state, target=target_state))
+    queue = AsyncEventQueue()
+    loop = _AsyncEventProcessingLoop(machine, queue)
+
+    task = asyncio.create_task(loop.start_loop())
+    queue.enqueue(mock_event)
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert machine.current_state == target_state
+
+    # The idle loop is blocked on the empty queue; stopping must wake it right away
+    await loop.stop_loop()
+    await asyncio.wait_for(task, timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_async_event_queue_dequeue_nowait():
+    from hsm.runtime.async_support import AsyncEventQueue
+
+    eq = AsyncEventQueue()
+    eq.enqueue(1)
+    eq.enqueue(2)
+    assert eq.dequeue_nowait() == 1
+    assert eq.dequeue_nowait() == 2
+    assert eq.dequeue_nowait() is None
+
+
+@pytest.mark.asyncio
+async def test_async_event_processing_loop_stop_mid_batch_keeps_queued_events():
+    from hsm.core.events import Event
+    from hsm.core.states import State
+    from hsm.core.transitions import Transition
+    from hsm.runtime.async_support import AsyncEventQueue, AsyncStateMachine, _AsyncEventProcessingLoop
+
+    idle_state = State("idle")
+    busy_state = State("busy")
+    hook = MagicMock()
+    stop_on_busy = True
+
+    async def on_enter(state):
+        # Stop the loop from inside the first transition of the batch
+        if stop_on_busy and state is busy_state:
+            await loop.stop_loop()
+
+    hook.on_enter = on_enter
+    machine = AsyncStateMachine(initial_state=idle_state, hooks=[hook])
+    machine.add_state(busy_state)
+    machine.add_transition(Transition(source=idle_state, target=busy_state))
+    machine.add_transition(Transition(source=busy_state, target=idle_state))
+    queue = AsyncEventQueue()
+    loop = _AsyncEventProcessingLoop(machine, queue)
+
+    for i in range(5):
+        queue.enqueue(Event(f"event{i}"))
+    await asyncio.wait_for(loop.start_loop(), timeout=1.0)
+
+    # Only the event that triggered the stop was consumed
+    assert [event.name for event in queue._items] == ["event1", "event2", "event3", "event4"]
+
+    # Restart and let the loop work through the leftovers and go idle
+    stop_on_busy = False
+    task = asyncio.create_task(loop.start_loop())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert not queue._items
+
+    # The head of the next batch is dequeued as the stop arrives and must survive it
+    queue.enqueue(Event("head"))
+    queue.enqueue(Event("tail"))
+    await loop.stop_loop()
+    await asyncio.wait_for(task, timeout=1.0)
+    assert [event.name for event in queue._items] == ["head", "tail"]
+
+
+@pytest.mark.asyncio
+async def test_async_state_machine_process_events(dummy_state):
+    from hsm.core.events import Event
+    from hsm.core.states import State
+    from hsm.core.transitions import Transition
+    from hsm.runtime.async_support import AsyncStateMachine
+
+    middle_state = State("middle")
+    final_state = State("final")
+    asm = AsyncStateMachine(initial_state=dummy_state)
+    asm.add_state(middle_state)
+    asm.add_state(final_state)
+    asm.add_transition(Transition(source=dummy_state, target=middle_state))
+    asm.add_transition(Transition(source=middle_state, target=final_state))
+    await asm.start()
+
+    handled = await asm.process_events([Event("first"), Event("second"), Event("third")])
+
+    # The third event has no transition out of the final state
+    assert handled == 2
+    assert asm.current_state == final_state
+
+
+@pytest.mark.asyncio
+async def test_async_event_processing_loop_enqueue_then_stop_keeps_event(dummy_state):
+    from hsm.core.events import Event
+    from hsm.core.states import State
+    from hsm.core.transitions import Transition
+    from hsm.runtime.async_support import AsyncEventQueue, AsyncStateMachine, _AsyncEventProcessingLoop
+
+    target_state = State("target")
+    machine = AsyncStateMachine(initial_state=dummy_state)
+    machine.add_state(target_state)
+    machine.add_transition(Transition(source=dummy_state, target=target_state))
+    queue = AsyncEventQueue()
+    loop = _AsyncEventProcessingLoop(machine, queue)
+
+    task = asyncio.create_task(loop.start_loop())
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    # The event lands while the idle loop is waiting, but stop is requested before it runs
+    event = Event("x")
+    queue.enqueue(event)
+    await loop.stop_loop()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    assert queue.dequeue_nowait() is event
+    assert queue.dequeue_nowait() is None
+
+
+@pytest.mark.asyncio
+async def test_async_event_queue_requeue():
+    from hsm.runtime.async_support import AsyncEventQueue
+
+    eq = AsyncEventQueue()
+    eq.enqueue(2)
+    eq.requeue(1)
+    assert await eq.dequeue() == 1
+    assert await eq.dequeue() == 2
+
+
 @pytest.mark.asyncio
 async def test_async_event_queue_priority_mode():
     from hsm.runtime.async_support import AsyncEventQueue
@@ -133,8 +267,8 @@ async def test_async_event_queue_priority_mode():
     eq = AsyncEventQueue(priority=True)
     assert eq.priority_mode is True
     # Even with priority=True, queue should still function as FIFO
-    await eq.enqueue(1)
-    await eq.enqueue(2)
+    eq.enqueue(1)
+    eq.enqueue(2)
     assert await eq.dequeue() == 1
     assert await eq.dequeue() == 2
 
@@ -175,9 +309,22 @@ async def test_async_event_queue_timeout():
     from hsm.runtime.async_support import AsyncEventQueue
 
     eq = AsyncEventQueue()
-    # Should return None when queue is empty (after timeout)
-    result = await eq.dequeue()
-    assert result is None
+    # Should block while the queue is empty
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(eq.dequeue(), timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_async_event_queue_wakes_waiting_consumer(mock_event):
+    from hsm.runtime.async_support import AsyncEventQueue
+
+    eq = AsyncEventQueue()
+    waiter = asyncio.create_task(eq.dequeue())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    eq.enqueue(mock_event)
+    assert await asyncio.wait_for(waiter, timeout=1.0) == mock_event
 
 
 @pytest.mark.asyncio
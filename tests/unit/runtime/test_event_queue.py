@@ -3,7 +3,6 @@
 # Licensed under the MIT License - see LICENSE file for details
 
 from threading import Lock
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -43,34 +42,6 @@ def test_event_queue_priority(mock_event):
     assert eq.priority_mode is True
 
 
-def test_event_queue_lock():
-    from hsm.runtime.event_queue import _EventQueueLock
-
-    mock_lock = MagicMock()
-    mock_lock.acquire = MagicMock()
-    mock_lock.release = MagicMock()
-
-    with _EventQueueLock(mock_lock):
-        mock_lock.acquire.assert_called_once()
-    mock_lock.release.assert_called_once()
-
-
-def test_event_queue_lock_exception():
-    from hsm.runtime.event_queue import _EventQueueLock
-
-    mock_lock = MagicMock()
-    mock_lock.acquire = MagicMock()
-    mock_lock.release = MagicMock()
-
-    try:
-        with _EventQueueLock(mock_lock):
-            raise Exception("Test error")
-    except Exception:
-        pass
-    mock_lock.acquire.assert_called_once()
-    mock_lock.release.assert_called_once()
-
-
 def test_priority_queue_wrapper():
     from hsm.core.events import Event
     from hsm.runtime.event_queue import _PriorityQueueWrapper
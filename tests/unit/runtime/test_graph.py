@@ -102,3 +102,26 @@ def test_multiple_transitions():
     assert len(transitions) == 2
     assert t1 in transitions
     assert t2 in transitions
+
+
+def test_get_best_transition():
+    """Test selecting the highest priority transition whose guards pass."""
+    graph = StateGraph()
+    state1 = State("state1")
+    state2 = State("state2")
+    state3 = State("state3")
+    state4 = State("state4")
+
+    for state in (state1, state2, state3, state4):
+        graph.add_state(state)
+
+    low = Transition(source=state1, target=state2, priority=1)
+    high = Transition(source=state1, target=state3, priority=5)
+    blocked = Transition(source=state1, target=state4, guards=[lambda e: False], priority=10)
+    graph.add_transition(low)
+    graph.add_transition(high)
+    graph.add_transition(blocked)
+
+    assert graph.get_best_transition(state1, Event("test")) is high
+    assert graph.get_best_transition(state2, Event("test")) is None
+    assert graph.get_best_transition(State("unknown"), Event("test")) is None
@@ -38,3 +38,79 @@ def test_timeout_scheduler():
         expired = sched.check_timeouts()
         assert len(expired) == 1
         assert expired[0].name == "TestTimeout"
+
+
+def test_timeout_scheduler_keeps_pending_timeouts():
+    from hsm.core.events import TimeoutEvent
+    from hsm.runtime.timers import TimeoutScheduler
+
+    sched = TimeoutScheduler()
+    now = time.time()
+    early = TimeoutEvent(name="Early", deadline=now + 0.1)
+    late = TimeoutEvent(name="Late", deadline=now + 0.5)
+    sched.schedule_timeout(late)
+    sched.schedule_timeout(early)
+
+    with patch("time.time", return_value=now + 0.2):
+        assert sched.check_timeouts() == [early]
+        # Already returned timeouts are not reported again
+        assert sched.check_timeouts() == []
+
+    with patch("time.time", return_value=now + 1.0):
+        assert sched.check_timeouts() == [late]
+
+
+def test_timeout_scheduler_cancel_timeout():
+    from hsm.core.events import TimeoutEvent
+    from hsm.runtime.timers import TimeoutScheduler
+
+    sched = TimeoutScheduler()
+    now = time.time()
+    cancelled = TimeoutEvent(name="Cancelled", deadline=now + 0.1)
+    kept = TimeoutEvent(name="Kept", deadline=now + 0.1)
+    sched.schedule_timeout(cancelled)
+    sched.schedule_timeout(kept)
+
+    assert sched.cancel_timeout(cancelled) is True
+    # Unknown or already cancelled events are a no-op
+    assert sched.cancel_timeout(cancelled) is False
+
+    with patch("time.time", return_value=now + 0.2):
+        assert sched.check_timeouts() == [kept]
+    assert sched.cancel_timeout(kept) is False
+
+
+def test_timeout_registry_purges_cancelled_entries():
+    from hsm.core.events import TimeoutEvent
+    from hsm.runtime.timers import _MIN_SCHEDULED_TIMEOUTS, _TimeoutRegistry
+
+    registry = _TimeoutRegistry()
+    now = time.time()
+    events = [TimeoutEvent(name=f"T{i}", deadline=now + 10 + i) for i in range(_MIN_SCHEDULED_TIMEOUTS * 2)]
+    for event in events:
+        registry.add(event)
+
+    for event in events[: _MIN_SCHEDULED_TIMEOUTS + 1]:
+        registry.remove(event)
+
+    # Crossing the cancelled fraction rebuilds the heap without the dead entries
+    assert len(registry._heap) == _MIN_SCHEDULED_TIMEOUTS - 1
+    assert registry._cancelled_count == 0
+
+    with patch("time.time", return_value=now + 1000):
+        assert registry.expired_events() == events[_MIN_SCHEDULED_TIMEOUTS + 1 :]
+
+
+def test_timeouts_with_caller_supplied_time():
+    from hsm.core.events import TimeoutEvent
+    from hsm.runtime.timers import TimeoutScheduler, Timer
+
+    t = Timer(deadline=100.0)
+    assert t.is_expired(now=99.0) is False
+    assert t.is_expired(now=100.0) is True
+
+    sched = TimeoutScheduler()
+    e = TimeoutEvent(name="TestTimeout", deadline=100.0)
+    sched.schedule_timeout(e)
+    assert sched.check_timeouts(now=99.0) == []
+    assert sched.check_timeouts(now=100.5) == [e]